@@ -2,14 +2,22 @@
 Launcher script for WhisperWriter.
 
 This script sets up the environment and launches the main application.
-It loads environment variables and runs the main.py script.
+It loads environment variables from .env (if present) and runs the main.py script.
 """
 
 import os
 import sys
 import subprocess
-from dotenv import load_dotenv
 
-print('Starting WhisperWriter...')
-load_dotenv()
-subprocess.run([sys.executable, os.path.join('src', 'main.py')])
+sys.stderr.write('Starting WhisperWriter...\n')
+env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+if os.path.exists(env_path):
+    from dotenv import load_dotenv
+    load_dotenv(env_path)
+main_script = os.path.join('src', 'main.py')
+if os.name == 'nt':
+    # os.execv on Windows spawns a detached child and returns control to the console
+    subprocess.run([sys.executable, main_script])
+else:
+    # Replace the launcher process instead of keeping a second interpreter alive
+    os.execv(sys.executable, [sys.executable, main_script])
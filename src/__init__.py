@@ -1,5 +1,5 @@
 from .input_events import InputEvent, KeyCode
-from .key_chord import KeyChord
+from .key_chord import KeyChord, ChordTransition
 from .key_listener import KeyListener
 from .input_backend.base import InputBackend
 from .input_backend.evdev_backend import EvdevBackend
@@ -9,6 +9,7 @@ __all__ = [
     'InputEvent',
     'KeyCode',
     'KeyChord',
+    'ChordTransition',
     'KeyListener',
     'InputBackend',
     'EvdevBackend',
@@ -11,34 +11,36 @@ import signal
 import sys
 import time
 import logging
+import threading
 from PyQt5.QtCore import QObject, QProcess
 from PyQt5.QtWidgets import QMessageBox, QSystemTrayIcon, QMenu, QAction
 from PyQt5.QtGui import QIcon
 
 from key_listener import KeyListener
-from result_thread import ResultThread
 from ui.main_window import MainWindow
 from ui.settings_window import SettingsWindow
 from ui.status_window import StatusWindow
-from transcription import create_local_model
 from input_simulation import InputSimulator
 from utils import ConfigManager
-from audioplayer import AudioPlayer
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class WhisperWriterAppManager(QObject):
     def __init__(self, app):
         super().__init__()
         self.app = app
+        self.key_listener = None
+        self.input_simulator = None
+        self.result_thread = None
+        self.main_window = None
         try:
             self.setup_signal_handler()
             self.init_windows()
             self.init_components()
             self.create_tray_icon()
-            logging.info("WhisperWriterAppManager initialized successfully")
+            logger.info("WhisperWriterAppManager initialized successfully")
         except Exception as e:
-            logging.error(f"Error initializing WhisperWriterAppManager: {e}")
+            logger.error(f"Error initializing WhisperWriterAppManager: {e}")
             raise
 
     def setup_signal_handler(self):
@@ -71,13 +73,32 @@ class WhisperWriterAppManager(QObject):
         self.key_listener.add_callback("on_deactivate", self.on_deactivation)
 
         model_options = ConfigManager.get_config_section('model_options')
-        self.local_model = create_local_model() if not model_options.get('use_api') else None
-
-        self.result_thread = None
+        self.local_model = None
+        self.local_model_ready = threading.Event()
+        if not model_options.get('use_api'):
+            # Load the model in the background so the UI comes up immediately
+            threading.Thread(target=self.load_local_model, name='LocalModelWarmup', daemon=True).start()
+        else:
+            self.local_model_ready.set()
 
         if not ConfigManager.get_config_value('misc', 'hide_status_window'):
             self.status_window = StatusWindow()
 
+    def load_local_model(self):
+        """Create the local transcription model and signal that it is ready."""
+        try:
+            from transcription import create_local_model
+            self.local_model = create_local_model()
+        except Exception as e:
+            logger.error(f"Error creating local model: {e}")
+        finally:
+            self.local_model_ready.set()
+
+    def get_local_model(self):
+        """Return the local model, waiting for the background load to finish if needed."""
+        self.local_model_ready.wait()
+        return self.local_model
+
     def create_tray_icon(self):
         """Create the system tray icon and its context menu."""
         self.tray_icon = QSystemTrayIcon(QIcon(os.path.join('assets', 'ww-logo.png')), self.app)
@@ -118,53 +139,56 @@ class WhisperWriterAppManager(QObject):
         """Start listening for the activation key combination."""
         try:
             self.key_listener.start()
-            logging.info("Started listening for activation key combination")
+            logger.info("Started listening for activation key combination")
         except Exception as e:
-            logging.error(f"Error starting key listener: {e}")
+            logger.error(f"Error starting key listener: {e}")
             QMessageBox.critical(self.main_window, "Error", f"Failed to start listening: {e}")
 
     def on_activation(self):
         """Called when the activation key combination is pressed."""
         try:
-            logging.info("Activation key combination triggered")
-            if self.result_thread and self.result_thread.isRunning():
+            logger.info("Activation key combination triggered")
+            if self.result_thread is not None and self.result_thread.isRunning():
                 recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
                 if recording_mode == 'press_to_toggle':
-                    logging.info("Stopping recording (press_to_toggle mode)")
+                    logger.info("Stopping recording (press_to_toggle mode)")
                     self.result_thread.stop_recording()
                 elif recording_mode == 'continuous':
-                    logging.info("Stopping result thread (continuous mode)")
+                    logger.info("Stopping result thread (continuous mode)")
                     self.stop_result_thread()
                 return
 
-            logging.info("Starting result thread")
+            logger.info("Starting result thread")
             self.start_result_thread()
         except Exception as e:
-            logging.error(f"Error handling activation: {e}")
+            logger.error(f"Error handling activation: {e}")
 
     def on_deactivation(self):
         """Called when the activation key combination is released."""
         recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
         if recording_mode == 'hold_to_record':
-            if self.result_thread and self.result_thread.isRunning():
-                logging.info("Stopping recording (hold_to_record mode)")
+            if self.result_thread is not None and self.result_thread.isRunning():
+                logger.info("Stopping recording (hold_to_record mode)")
                 self.result_thread.stop_recording()
 
     def start_result_thread(self):
         """Start the result thread to record audio and transcribe it."""
-        if self.result_thread and self.result_thread.isRunning():
+        if self.result_thread is not None and self.result_thread.isRunning():
             return
 
-        self.result_thread = ResultThread(self.local_model)
-        if not ConfigManager.get_config_value('misc', 'hide_status_window'):
-            self.result_thread.statusSignal.connect(self.status_window.updateStatus)
-            self.status_window.closeSignal.connect(self.stop_result_thread)
-        self.result_thread.resultSignal.connect(self.on_transcription_complete)
-        self.result_thread.start()
+        # Create the thread and wire its signals once, then reuse it for every recording
+        if self.result_thread is None:
+            from result_thread import ResultThread
+            self.result_thread = ResultThread(local_model_getter=self.get_local_model)
+            if not ConfigManager.get_config_value('misc', 'hide_status_window'):
+                self.result_thread.statusSignal.connect(self.status_window.updateStatus)
+                self.status_window.closeSignal.connect(self.stop_result_thread)
+            self.result_thread.resultSignal.connect(self.on_transcription_complete)
+        self.result_thread.start_new_recording()
 
     def stop_result_thread(self):
         """Stop the result thread."""
-        if self.result_thread and self.result_thread.isRunning():
+        if self.result_thread is not None and self.result_thread.isRunning():
             self.result_thread.stop()
 
     def on_transcription_complete(self, result):
@@ -172,6 +196,7 @@ class WhisperWriterAppManager(QObject):
         self.input_simulator.typewrite(result)
 
         if ConfigManager.get_config_value('misc', 'noise_on_completion'):
+            from audioplayer import AudioPlayer
             AudioPlayer(os.path.join('assets', 'beep.wav')).play(block=True)
 
         if ConfigManager.get_config_value('recording_options', 'recording_mode') == 'continuous':
@@ -182,19 +207,27 @@ class WhisperWriterAppManager(QObject):
     def restart_app(self):
         """Restart the application to apply new settings."""
         self.exit_app()
-        QProcess.startDetached(sys.executable, sys.argv)
+        if os.name == 'nt':
+            QProcess.startDetached(sys.executable, sys.argv)
+        else:
+            # Replace this process in place rather than spawning a second interpreter; exec does not
+            # release the microphone stream or flush Python's stdio buffers, so do both first
+            self.stop_result_thread()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, [sys.executable, *sys.argv])
 
     def exit_app(self):
         """Exit the application."""
         try:
-            if hasattr(self, 'key_listener'):
+            if self.key_listener is not None:
                 self.key_listener.stop()
-            if hasattr(self, 'input_simulator'):
+            if self.input_simulator is not None:
                 self.input_simulator.cleanup()
             self.app.quit()
-            logging.info("Application exited")
+            logger.info("Application exited")
         except Exception as e:
-            logging.error(f"Error exiting application: {e}")
+            logger.error(f"Error exiting application: {e}")
             sys.exit(1)
 
     def run(self):
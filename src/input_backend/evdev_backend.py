@@ -1,9 +1,9 @@
-import select
 import logging
+import selectors
 from input_backend.base import InputBackend
 from input_events import KeyCode, InputEvent
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(filename)s:%(funcName)s] - %(message)s')
+logger = logging.getLogger(__name__)
 
 class EvdevBackend(InputBackend):
     @classmethod
@@ -12,7 +12,7 @@ class EvdevBackend(InputBackend):
             import evdev
             return True
         except ImportError:
-            logging.warning("Evdev is not available")
+            logger.warning("Evdev is not available")
             return False
 
     def __init__(self):
@@ -21,7 +21,8 @@ class EvdevBackend(InputBackend):
         self.evdev = None
         self.thread = None
         self.stop_event = None
-        logging.info("Initialized EvdevBackend")
+        self.selector = None
+        logger.info("Initialized EvdevBackend")
 
     def start(self):
         """Start the evdev backend."""
@@ -36,34 +37,11 @@ class EvdevBackend(InputBackend):
             self.stop_event = threading.Event()
             self._setup_signal_handler()
             self._start_listening()
-            logging.info("Started EvdevBackend")
+            logger.info("Started EvdevBackend")
         except Exception as e:
-            logging.error(f"Error starting EvdevBackend: {e}")
+            logger.error(f"Error starting EvdevBackend: {e}")
             raise
 
-    def _listen_loop(self):
-        """Main loop for listening to input events using epoll."""
-        try:
-            import select
-            epoll = select.epoll()
-            for device in self.devices:
-                epoll.register(device.fileno(), select.EPOLLIN)
-
-            while not self.stop_event.is_set():
-                try:
-                    events = epoll.poll(0.1)
-                    for fileno, _ in events:
-                        device = next(d for d in self.devices if d.fileno() == fileno)
-                        self._read_device_events(device)
-                except Exception as e:
-                    if self.stop_event.is_set():
-                        break
-                    logging.error(f"Unexpected error in _listen_loop: {e}")
-
-            epoll.close()
-        except Exception as e:
-            logging.error(f"Error in _listen_loop: {e}")
-
     def _setup_signal_handler(self):
         """Set up signal handlers for graceful shutdown."""
         try:
@@ -76,7 +54,7 @@ class EvdevBackend(InputBackend):
             signal.signal(signal.SIGTERM, signal_handler)
             signal.signal(signal.SIGINT, signal_handler)
         except Exception as e:
-            logging.error(f"Error setting up signal handler: {e}")
+            logger.error(f"Error setting up signal handler: {e}")
 
     def stop(self):
         """Stop the evdev backend and clean up resources."""
@@ -97,7 +75,7 @@ class EvdevBackend(InputBackend):
                     pass  # Ignore errors when closing devices
             self.devices = []
         except Exception as e:
-            logging.error(f"Error stopping EvdevBackend: {e}")
+            logger.error(f"Error stopping EvdevBackend: {e}")
 
     def _start_listening(self):
         """Start the listening thread."""
@@ -106,31 +84,40 @@ class EvdevBackend(InputBackend):
             self.thread = threading.Thread(target=self._listen_loop)
             self.thread.start()
         except Exception as e:
-            logging.error(f"Error starting listening thread: {e}")
+            logger.error(f"Error starting listening thread: {e}")
 
     def _listen_loop(self):
-        """Main loop for listening to input events."""
+        """Main loop for listening to input events using the platform selector (epoll on Linux)."""
         try:
-            import select
+            self.selector = selectors.DefaultSelector()
+            for device in self.devices:
+                self.selector.register(device.fd, selectors.EVENT_READ, device)
+
             while not self.stop_event.is_set():
                 try:
-                    # Wait for input events with a timeout of 0.1 seconds
-                    r, _, _ = select.select(self.devices, [], [], 0.1)
-                    for device in r:
-                        self._read_device_events(device)
+                    # Block until a device is readable; the timeout only bounds how long stop() waits
+                    for key, _ in self.selector.select(timeout=0.5):
+                        self._drain_device_events(key.data)
                 except Exception as e:
                     if self.stop_event.is_set():
                         break
                     print(f"Unexpected error in _listen_loop: {e}")
+
+            self.selector.close()
+            self.selector = None
         except Exception as e:
-            logging.error(f"Error in _listen_loop: {e}")
+            logger.error(f"Error in _listen_loop: {e}")
 
-    def _read_device_events(self, device):
-        """Read and process events from a single device."""
+    def _drain_device_events(self, device):
+        """Read and process every pending event from a single device until it would block."""
+        ev_key = self.evdev.ecodes.EV_KEY
         try:
-            for event in device.read():
-                if event.type == self.evdev.ecodes.EV_KEY:
-                    self._handle_input_event(event)
+            while True:
+                for event in device.read():
+                    if event.type == ev_key:
+                        self._handle_input_event(event)
+        except BlockingIOError:
+            return  # Device drained
         except Exception as e:
             self._handle_device_error(device, e)
 
@@ -138,25 +125,25 @@ class EvdevBackend(InputBackend):
         """Handle errors that occur when reading from a device."""
         try:
             import errno
-            if isinstance(error, BlockingIOError) and error.errno == errno.EAGAIN:
-                return  # Non-blocking IO is expected, just continue
             if isinstance(error, OSError) and (error.errno == errno.EBADF or error.errno == errno.ENODEV):
                 print(f"Device {device.path} is no longer available. Removing it.")
                 self.devices.remove(device)
+                if self.selector:
+                    self.selector.unregister(device.fd)
             else:
                 print(f"Unexpected error reading device: {error}")
         except Exception as e:
-            logging.error(f"Error handling device error: {e}")
+            logger.error(f"Error handling device error: {e}")
 
     def _handle_input_event(self, event):
         """Process a single input event."""
         try:
             key_code, event_type = self._translate_key_event(event)
             if key_code is not None and event_type is not None:
-                logging.debug(f"Evdev event: key={key_code}, type={event_type}")
+                logger.debug(f"Evdev event: key={key_code}, type={event_type}")
                 self.on_input_event((key_code, event_type))
         except Exception as e:
-            logging.error(f"Error handling input event: {e}")
+            logger.error(f"Error handling input event: {e}")
 
     def _translate_key_event(self, event) -> tuple[KeyCode | None, InputEvent | None]:
         """Translate an evdev event to our internal representation."""
@@ -178,7 +165,7 @@ class EvdevBackend(InputBackend):
 
             return key_code, event_type
         except Exception as e:
-            logging.error(f"Error translating key event: {e}")
+            logger.error(f"Error translating key event: {e}")
             return None, None
 
     def _create_key_map(self):
@@ -373,7 +360,7 @@ class EvdevBackend(InputBackend):
                 self.evdev.ecodes.BTN_TASK: KeyCode.MOUSE_SIDE3,
             }
         except Exception as e:
-            logging.error(f"Error creating key map: {e}")
+            logger.error(f"Error creating key map: {e}")
             return {}
 
     def on_input_event(self, event):
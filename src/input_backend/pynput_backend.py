@@ -2,16 +2,20 @@ import logging
 from input_backend.base import InputBackend
 from input_events import KeyCode, InputEvent
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(filename)s:%(funcName)s] - %(message)s')
+logger = logging.getLogger(__name__)
 
 class PynputBackend(InputBackend):
+    # InputBackend has no __slots__, so instances keep a __dict__ for the
+    # on_input_event callback that KeyListener assigns
+    __slots__ = ('keyboard_listener', 'mouse_listener', 'keyboard', 'mouse', '_special_map', '_char_map', '_vk_map', '_mouse_map')
+
     @classmethod
     def is_available(cls) -> bool:
         try:
             import pynput
             return True
         except ImportError:
-            logging.warning("Pynput is not available")
+            logger.warning("Pynput is not available")
             return False
 
     def __init__(self):
@@ -19,8 +23,11 @@ class PynputBackend(InputBackend):
         self.mouse_listener = None
         self.keyboard = None
         self.mouse = None
-        self.key_map = None
-        logging.info("Initialized PynputBackend")
+        self._special_map = None
+        self._char_map = None
+        self._vk_map = None
+        self._mouse_map = None
+        logger.info("Initialized PynputBackend")
 
     def start(self):
         """Start listening for keyboard and mouse events."""
@@ -29,7 +36,9 @@ class PynputBackend(InputBackend):
                 from pynput import keyboard, mouse
                 self.keyboard = keyboard
                 self.mouse = mouse
-                self.key_map = self._create_key_map()
+            # The key maps survive stop()/start() cycles, so only build them once
+            if self._char_map is None:
+                self._create_key_map()
 
             self.keyboard_listener = self.keyboard.Listener(
                 on_press=self._on_keyboard_press,
@@ -40,9 +49,9 @@ class PynputBackend(InputBackend):
             )
             self.keyboard_listener.start()
             self.mouse_listener.start()
-            logging.info("Started PynputBackend")
+            logger.info("Started PynputBackend")
         except Exception as e:
-            logging.error(f"Error starting PynputBackend: {e}")
+            logger.error(f"Error starting PynputBackend: {e}")
             raise
 
     def stop(self):
@@ -54,63 +63,57 @@ class PynputBackend(InputBackend):
             if self.mouse_listener:
                 self.mouse_listener.stop()
                 self.mouse_listener = None
-            logging.info("Stopped PynputBackend")
+            logger.info("Stopped PynputBackend")
         except Exception as e:
-            logging.error(f"Error stopping PynputBackend: {e}")
+            logger.error(f"Error stopping PynputBackend: {e}")
 
     def _translate_key_event(self, native_event) -> tuple[KeyCode | None, InputEvent]:
         """Translate a pynput event to our internal event representation."""
-        try:
-            pynput_key, is_press = native_event
-            key_code = self._get_key_code(pynput_key)
-            event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-            return key_code, event_type
-        except Exception as e:
-            logging.error(f"Error translating key event: {e}")
-            return None, InputEvent.KEY_PRESS
+        pynput_key, is_press = native_event
+        key_code = self._get_key_code(pynput_key)
+        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
+        return key_code, event_type
 
     def _get_key_code(self, pynput_key) -> KeyCode | None:
         """Get the corresponding KeyCode for a pynput key."""
         if isinstance(pynput_key, self.keyboard.KeyCode):
-            if pynput_key.char:
-                return self.key_map.get(self.keyboard.KeyCode.from_char(pynput_key.char.lower()))
-            elif pynput_key.vk:
-                return self.key_map.get(self.keyboard.KeyCode.from_vk(pynput_key.vk))
-        return self.key_map.get(pynput_key)
+            char = pynput_key.char
+            return self._char_map.get(char.lower()) if char else self._vk_map.get(pynput_key.vk)
+        return self._special_map.get(pynput_key)
 
     def _on_keyboard_press(self, key):
         """Handle keyboard press events."""
-        try:
-            translated_event = self._translate_key_event((key, True))
-            if translated_event[0] is not None:
-                logging.debug(f"Pynput keyboard press: key={translated_event[0]}")
-                self.on_input_event(translated_event)
-        except Exception as e:
-            logging.error(f"Error handling keyboard press event: {e}")
+        translated_event = self._translate_key_event((key, True))
+        if translated_event[0] is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pynput keyboard press: key=%s", translated_event[0])
+            self.on_input_event(translated_event)
 
     def _on_keyboard_release(self, key):
         """Handle keyboard release events."""
-        try:
-            translated_event = self._translate_key_event((key, False))
-            if translated_event[0] is not None:
-                logging.debug(f"Pynput keyboard release: key={translated_event[0]}")
-                self.on_input_event(translated_event)
-        except Exception as e:
-            logging.error(f"Error handling keyboard release event: {e}")
+        translated_event = self._translate_key_event((key, False))
+        if translated_event[0] is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pynput keyboard release: key=%s", translated_event[0])
+            self.on_input_event(translated_event)
 
     def _on_mouse_click(self, x, y, button, pressed):
         """Handle mouse click events."""
-        try:
-            translated_event = self._translate_key_event((button, pressed))
-            logging.debug(f"Pynput mouse click: button={translated_event[0]}, pressed={pressed}")
-            self.on_input_event(translated_event)
-        except Exception as e:
-            logging.error(f"Error handling mouse click event: {e}")
+        key_code = self._mouse_map.get(button)
+        if key_code is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pynput mouse click: button=%s, pressed=%s", key_code, pressed)
+            self.on_input_event((key_code, InputEvent.KEY_PRESS if pressed else InputEvent.KEY_RELEASE))
 
     def _create_key_map(self):
-        """Create a mapping from pynput keys to our internal KeyCode enum."""
+        """
+        Create mappings from pynput keys and mouse buttons to our internal KeyCode enum.
+
+        Character and virtual-key codes are keyed on their primitive values so
+        that translating an event never has to construct a pynput KeyCode.
+        """
         try:
-            return {
+            self._special_map = {
                 # Modifier keys
                 self.keyboard.Key.ctrl_l: KeyCode.CTRL_LEFT,
                 self.keyboard.Key.ctrl_r: KeyCode.CTRL_RIGHT,
@@ -143,46 +146,6 @@ class PynputBackend(InputBackend):
                 self.keyboard.Key.f19: KeyCode.F19,
                 self.keyboard.Key.f20: KeyCode.F20,
 
-                # Number keys
-                self.keyboard.KeyCode.from_char('1'): KeyCode.ONE,
-                self.keyboard.KeyCode.from_char('2'): KeyCode.TWO,
-                self.keyboard.KeyCode.from_char('3'): KeyCode.THREE,
-                self.keyboard.KeyCode.from_char('4'): KeyCode.FOUR,
-                self.keyboard.KeyCode.from_char('5'): KeyCode.FIVE,
-                self.keyboard.KeyCode.from_char('6'): KeyCode.SIX,
-                self.keyboard.KeyCode.from_char('7'): KeyCode.SEVEN,
-                self.keyboard.KeyCode.from_char('8'): KeyCode.EIGHT,
-                self.keyboard.KeyCode.from_char('9'): KeyCode.NINE,
-                self.keyboard.KeyCode.from_char('0'): KeyCode.ZERO,
-
-                # Letter keys
-                self.keyboard.KeyCode.from_char('a'): KeyCode.A,
-                self.keyboard.KeyCode.from_char('b'): KeyCode.B,
-                self.keyboard.KeyCode.from_char('c'): KeyCode.C,
-                self.keyboard.KeyCode.from_char('d'): KeyCode.D,
-                self.keyboard.KeyCode.from_char('e'): KeyCode.E,
-                self.keyboard.KeyCode.from_char('f'): KeyCode.F,
-                self.keyboard.KeyCode.from_char('g'): KeyCode.G,
-                self.keyboard.KeyCode.from_char('h'): KeyCode.H,
-                self.keyboard.KeyCode.from_char('i'): KeyCode.I,
-                self.keyboard.KeyCode.from_char('j'): KeyCode.J,
-                self.keyboard.KeyCode.from_char('k'): KeyCode.K,
-                self.keyboard.KeyCode.from_char('l'): KeyCode.L,
-                self.keyboard.KeyCode.from_char('m'): KeyCode.M,
-                self.keyboard.KeyCode.from_char('n'): KeyCode.N,
-                self.keyboard.KeyCode.from_char('o'): KeyCode.O,
-                self.keyboard.KeyCode.from_char('p'): KeyCode.P,
-                self.keyboard.KeyCode.from_char('q'): KeyCode.Q,
-                self.keyboard.KeyCode.from_char('r'): KeyCode.R,
-                self.keyboard.KeyCode.from_char('s'): KeyCode.S,
-                self.keyboard.KeyCode.from_char('t'): KeyCode.T,
-                self.keyboard.KeyCode.from_char('u'): KeyCode.U,
-                self.keyboard.KeyCode.from_char('v'): KeyCode.V,
-                self.keyboard.KeyCode.from_char('w'): KeyCode.W,
-                self.keyboard.KeyCode.from_char('x'): KeyCode.X,
-                self.keyboard.KeyCode.from_char('y'): KeyCode.Y,
-                self.keyboard.KeyCode.from_char('z'): KeyCode.Z,
-
                 # Special keys
                 self.keyboard.Key.space: KeyCode.SPACE,
                 self.keyboard.Key.enter: KeyCode.ENTER,
@@ -209,34 +172,6 @@ class PynputBackend(InputBackend):
 
                 # Numpad keys
                 self.keyboard.Key.num_lock: KeyCode.NUM_LOCK,
-                self.keyboard.KeyCode.from_vk(96): KeyCode.NUMPAD_0,
-                self.keyboard.KeyCode.from_vk(97): KeyCode.NUMPAD_1,
-                self.keyboard.KeyCode.from_vk(98): KeyCode.NUMPAD_2,
-                self.keyboard.KeyCode.from_vk(99): KeyCode.NUMPAD_3,
-                self.keyboard.KeyCode.from_vk(100): KeyCode.NUMPAD_4,
-                self.keyboard.KeyCode.from_vk(101): KeyCode.NUMPAD_5,
-                self.keyboard.KeyCode.from_vk(102): KeyCode.NUMPAD_6,
-                self.keyboard.KeyCode.from_vk(103): KeyCode.NUMPAD_7,
-                self.keyboard.KeyCode.from_vk(104): KeyCode.NUMPAD_8,
-                self.keyboard.KeyCode.from_vk(105): KeyCode.NUMPAD_9,
-                self.keyboard.KeyCode.from_vk(107): KeyCode.NUMPAD_ADD,
-                self.keyboard.KeyCode.from_vk(109): KeyCode.NUMPAD_SUBTRACT,
-                self.keyboard.KeyCode.from_vk(106): KeyCode.NUMPAD_MULTIPLY,
-                self.keyboard.KeyCode.from_vk(111): KeyCode.NUMPAD_DIVIDE,
-                self.keyboard.KeyCode.from_vk(110): KeyCode.NUMPAD_DECIMAL,
-
-                # Additional special characters
-                self.keyboard.KeyCode.from_char('-'): KeyCode.MINUS,
-                self.keyboard.KeyCode.from_char('='): KeyCode.EQUALS,
-                self.keyboard.KeyCode.from_char('['): KeyCode.LEFT_BRACKET,
-                self.keyboard.KeyCode.from_char(']'): KeyCode.RIGHT_BRACKET,
-                self.keyboard.KeyCode.from_char(';'): KeyCode.SEMICOLON,
-                self.keyboard.KeyCode.from_char("'"): KeyCode.QUOTE,
-                self.keyboard.KeyCode.from_char('`'): KeyCode.BACKQUOTE,
-                self.keyboard.KeyCode.from_char('\\'): KeyCode.BACKSLASH,
-                self.keyboard.KeyCode.from_char(','): KeyCode.COMMA,
-                self.keyboard.KeyCode.from_char('.'): KeyCode.PERIOD,
-                self.keyboard.KeyCode.from_char('/'): KeyCode.SLASH,
 
                 # Media keys
                 self.keyboard.Key.media_volume_mute: KeyCode.MUTE,
@@ -245,15 +180,87 @@ class PynputBackend(InputBackend):
                 self.keyboard.Key.media_play_pause: KeyCode.PLAY_PAUSE,
                 self.keyboard.Key.media_next: KeyCode.NEXT_TRACK,
                 self.keyboard.Key.media_previous: KeyCode.PREV_TRACK,
+            }
+            self._char_map = {
+                # Number keys
+                '1': KeyCode.ONE,
+                '2': KeyCode.TWO,
+                '3': KeyCode.THREE,
+                '4': KeyCode.FOUR,
+                '5': KeyCode.FIVE,
+                '6': KeyCode.SIX,
+                '7': KeyCode.SEVEN,
+                '8': KeyCode.EIGHT,
+                '9': KeyCode.NINE,
+                '0': KeyCode.ZERO,
+
+                # Letter keys
+                'a': KeyCode.A,
+                'b': KeyCode.B,
+                'c': KeyCode.C,
+                'd': KeyCode.D,
+                'e': KeyCode.E,
+                'f': KeyCode.F,
+                'g': KeyCode.G,
+                'h': KeyCode.H,
+                'i': KeyCode.I,
+                'j': KeyCode.J,
+                'k': KeyCode.K,
+                'l': KeyCode.L,
+                'm': KeyCode.M,
+                'n': KeyCode.N,
+                'o': KeyCode.O,
+                'p': KeyCode.P,
+                'q': KeyCode.Q,
+                'r': KeyCode.R,
+                's': KeyCode.S,
+                't': KeyCode.T,
+                'u': KeyCode.U,
+                'v': KeyCode.V,
+                'w': KeyCode.W,
+                'x': KeyCode.X,
+                'y': KeyCode.Y,
+                'z': KeyCode.Z,
 
-                # Mouse buttons
+                # Additional special characters
+                '-': KeyCode.MINUS,
+                '=': KeyCode.EQUALS,
+                '[': KeyCode.LEFT_BRACKET,
+                ']': KeyCode.RIGHT_BRACKET,
+                ';': KeyCode.SEMICOLON,
+                "'": KeyCode.QUOTE,
+                '`': KeyCode.BACKQUOTE,
+                '\\': KeyCode.BACKSLASH,
+                ',': KeyCode.COMMA,
+                '.': KeyCode.PERIOD,
+                '/': KeyCode.SLASH,
+            }
+            self._vk_map = {
+                # Numpad keys
+                96: KeyCode.NUMPAD_0,
+                97: KeyCode.NUMPAD_1,
+                98: KeyCode.NUMPAD_2,
+                99: KeyCode.NUMPAD_3,
+                100: KeyCode.NUMPAD_4,
+                101: KeyCode.NUMPAD_5,
+                102: KeyCode.NUMPAD_6,
+                103: KeyCode.NUMPAD_7,
+                104: KeyCode.NUMPAD_8,
+                105: KeyCode.NUMPAD_9,
+                107: KeyCode.NUMPAD_ADD,
+                109: KeyCode.NUMPAD_SUBTRACT,
+                106: KeyCode.NUMPAD_MULTIPLY,
+                111: KeyCode.NUMPAD_DIVIDE,
+                110: KeyCode.NUMPAD_DECIMAL,
+            }
+            self._mouse_map = {
                 self.mouse.Button.left: KeyCode.MOUSE_LEFT,
                 self.mouse.Button.right: KeyCode.MOUSE_RIGHT,
                 self.mouse.Button.middle: KeyCode.MOUSE_MIDDLE,
             }
         except Exception as e:
-            logging.error(f"Error creating key map: {e}")
-            return {}
+            logger.error(f"Error creating key map: {e}")
+            self._special_map, self._char_map, self._vk_map, self._mouse_map = {}, {}, {}, {}
 
     def on_input_event(self, event):
         """
@@ -263,4 +270,4 @@ class PynputBackend(InputBackend):
         try:
             pass
         except Exception as e:
-            logging.error(f"Error in on_input_event: {e}")
+            logger.error(f"Error in on_input_event: {e}")
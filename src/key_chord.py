@@ -1,41 +1,73 @@
 import logging
+from enum import Enum, auto
 from typing import Set
 from input_events import KeyCode, InputEvent
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(filename)s:%(funcName)s] - %(message)s')
+logger = logging.getLogger(__name__)
+
+_PRESS = InputEvent.KEY_PRESS
+_RELEASE = InputEvent.KEY_RELEASE
+
+class ChordTransition(Enum):
+    ACTIVATED = auto()
+    DEACTIVATED = auto()
 
 class KeyChord:
+    __slots__ = ('keys', '_bits', '_plain_mask', '_group_masks', '_pressed', '_was_active')
+
     def __init__(self, keys: Set[KeyCode | frozenset[KeyCode]]):
         self.keys = keys
-        self.pressed_keys: Set[KeyCode] = set()
-        logging.info(f"Initialized KeyChord with keys: {keys}")
-
-    def update(self, key: KeyCode, event_type: InputEvent) -> bool:
-        try:
-            if event_type == InputEvent.KEY_PRESS:
-                self.pressed_keys.add(key)
-            elif event_type == InputEvent.KEY_RELEASE:
-                self.pressed_keys.discard(key)
-
-            logging.debug(f"Current pressed keys: {self.pressed_keys}")
-            logging.debug(f"Required keys: {self.keys}")
-
-            is_active = self.is_active()
-            logging.debug(f"KeyChord active: {is_active}")
-            return is_active
-        except Exception as e:
-            logging.error(f"Error updating KeyChord: {e}")
-            return False
+        # Give every key in the chord its own bit, so the pressed state is a
+        # single int and is_active() is a couple of mask comparisons. Modifier
+        # groups (e.g. left/right CTRL) are satisfied by any bit in their mask.
+        plain = [k for k in keys if not isinstance(k, frozenset)]
+        groups = [k for k in keys if isinstance(k, frozenset)]
+        relevant = set(plain).union(*groups)
+        self._bits = {key: 1 << i for i, key in enumerate(sorted(relevant, key=lambda k: k.value))}
+        self._plain_mask = sum(self._bits[k] for k in plain)
+        self._group_masks = tuple(sum(self._bits[k] for k in group) for group in groups)
+        self._pressed = 0
+        self._was_active = False
+        logger.info("Initialized KeyChord with keys: %s", keys)
+
+    @property
+    def pressed_keys(self) -> Set[KeyCode]:
+        """The chord keys that are currently held down."""
+        return {key for key, bit in self._bits.items() if self._pressed & bit}
+
+    def update_batch(self, events) -> tuple[ChordTransition, ...]:
+        """
+        Apply a batch of (key, event_type) events and return every transition, in order.
+
+        Pressing a key can only activate the chord and releasing one can only
+        deactivate it, so the chord is re-evaluated only on events that could
+        flip its current state. Round trips inside one batch are preserved in
+        both directions (e.g. release + re-press of an active chord yields
+        DEACTIVATED followed by ACTIVATED).
+        """
+        bits = self._bits
+        active = self._was_active
+        transitions = []
+        for key, event_type in events:
+            bit = bits.get(key)
+            if bit is None:
+                continue
+            if event_type is _PRESS:
+                self._pressed |= bit
+                if not active and self.is_active():
+                    active = True
+                    transitions.append(ChordTransition.ACTIVATED)
+            elif event_type is _RELEASE:
+                self._pressed &= ~bit
+                if active and not self.is_active():
+                    active = False
+                    transitions.append(ChordTransition.DEACTIVATED)
+
+        self._was_active = active
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current pressed keys: %s, required keys: %s, active: %s", self.pressed_keys, self.keys, active)
+        return tuple(transitions)
 
     def is_active(self) -> bool:
-        try:
-            for key in self.keys:
-                if isinstance(key, frozenset):
-                    if not any(k in self.pressed_keys for k in key):
-                        return False
-                elif key not in self.pressed_keys:
-                    return False
-            return len(self.pressed_keys) == len(self.keys)  # Ensure all required keys are pressed
-        except Exception as e:
-            logging.error(f"Error checking if KeyChord is active: {e}")
-            return False
\ No newline at end of file
+        pressed = self._pressed
+        return pressed & self._plain_mask == self._plain_mask and all(pressed & mask for mask in self._group_masks)
@@ -1,91 +1,99 @@
 import logging
-from typing import Callable, Set
+import queue
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Callable
 from input_events import KeyCode, InputEvent
-from key_chord import KeyChord
-from input_backend.base import InputBackend
+from key_chord import KeyChord, ChordTransition
 from input_backend.evdev_backend import EvdevBackend
 from input_backend.pynput_backend import PynputBackend
 from utils import ConfigManager
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(filename)s:%(funcName)s] - %(message)s')
+logger = logging.getLogger(__name__)
+
+_MOD_MAP = {
+    'CTRL': frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT}),
+    'SHIFT': frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT}),
+    'ALT': frozenset({KeyCode.ALT_LEFT, KeyCode.ALT_RIGHT}),
+    'META': frozenset({KeyCode.META_LEFT, KeyCode.META_RIGHT}),
+}
+_KEYCODE_BY_NAME = {keycode.name: keycode for keycode in KeyCode}
+
+# Queued to tell the callback worker to exit
+_STOP_CALLBACKS = object()
+
+_BACKEND_CLASSES = (EvdevBackend, PynputBackend)
+_BACKEND_MAP = {
+    'evdev': EvdevBackend,
+    'pynput': PynputBackend
+}
 
 class KeyListener:
+    __slots__ = ('active_backend', '_backend_name', 'key_chord', '_on_activate', '_on_deactivate', '_q', '_consumer', '_alive', '_event_avail', '_cb_queue', '_cb_worker')
+
     def __init__(self):
-        self.backends = []
         self.active_backend = None
+        self._backend_name = None
         self.key_chord = None
-        self.callbacks = {
-            "on_activate": [],
-            "on_deactivate": []
-        }
+        self._on_activate: list[Callable] = []
+        self._on_deactivate: list[Callable] = []
+        # Backends only enqueue events; chord matching and callbacks run on
+        # a separate consumer thread so the OS input thread is never blocked
+        self._q = deque()
+        self._event_avail = threading.Event()
+        self._alive = False
+        self._consumer = None
+        # Callbacks run on their own worker so a slow callback does not hold up key tracking
+        self._cb_queue = None
+        self._cb_worker = None
         try:
             self.load_activation_keys()
-            self.initialize_backends()
-            self.select_backend_from_config()
-            logging.info(f"Current activation key combination: {self.key_chord.keys}")
+            self._ensure_backend(ConfigManager.get_config_value('recording_options', 'input_backend'))
+            logger.info(f"Current activation key combination: {self.key_chord.keys}")
         except Exception as e:
-            logging.error(f"Error initializing KeyListener: {e}")
+            logger.error(f"Error initializing KeyListener: {e}")
             raise
 
-    def initialize_backends(self):
-        backend_classes = [EvdevBackend, PynputBackend]
-        try:
-            self.backends = [backend_class() for backend_class in backend_classes if backend_class.is_available()]
-            logging.info(f"Initialized backends: {[b.__class__.__name__ for b in self.backends]}")
-        except Exception as e:
-            logging.error(f"Error initializing backends: {e}")
-            raise
+    def _ensure_backend(self, preferred_backend: str):
+        """Instantiate only the preferred backend, falling back to the first available one."""
+        logger.info(f"Preferred backend from config: {preferred_backend}")
+
+        candidates = _BACKEND_CLASSES
+        if preferred_backend in _BACKEND_MAP:
+            preferred_class = _BACKEND_MAP[preferred_backend]
+            candidates = (preferred_class,) + tuple(b for b in _BACKEND_CLASSES if b is not preferred_class)
+        elif preferred_backend != 'auto':
+            logger.warning(f"Unknown backend '{preferred_backend}'. Falling back to auto selection.")
+
+        for backend_class in candidates:
+            if backend_class.is_available():
+                if preferred_backend in _BACKEND_MAP and backend_class is not _BACKEND_MAP[preferred_backend]:
+                    logger.warning(f"Preferred backend '{preferred_backend}' is not available. Falling back to auto selection.")
+                self.active_backend = backend_class()
+                self.active_backend.on_input_event = self.on_input_event
+                self._backend_name = preferred_backend
+                logger.info(f"Selected backend: {backend_class.__name__}")
+                return
+        raise RuntimeError("No supported input backend found")
 
-    def select_backend_from_config(self):
-        try:
-            preferred_backend = ConfigManager.get_config_value('recording_options', 'input_backend')
-            logging.info(f"Preferred backend from config: {preferred_backend}")
-
-            if preferred_backend == 'auto':
-                self.select_active_backend()
-            else:
-                backend_map = {
-                    'evdev': EvdevBackend,
-                    'pynput': PynputBackend
-                }
-
-                if preferred_backend in backend_map:
-                    try:
-                        self.set_active_backend(backend_map[preferred_backend])
-                    except ValueError as e:
-                        logging.warning(f"Preferred backend '{preferred_backend}' is not available. Falling back to auto selection. Error: {e}")
-                        self.select_active_backend()
-                else:
-                    logging.warning(f"Unknown backend '{preferred_backend}'. Falling back to auto selection.")
-                    self.select_active_backend()
-            
-            logging.info(f"Selected backend: {self.active_backend.__class__.__name__}")
-        except Exception as e:
-            logging.error(f"Error selecting backend from config: {e}")
-            raise
+    def update_backend(self):
+        """Switch to the backend selected in the config if it has changed."""
+        preferred_backend = ConfigManager.get_config_value('recording_options', 'input_backend')
+        if preferred_backend == self._backend_name:
+            return
 
-    def select_active_backend(self):
-        if not self.backends:
-            raise RuntimeError("No supported input backend found")
-        self.active_backend = self.backends[0]
-        self.active_backend.on_input_event = self.on_input_event
-
-    def set_active_backend(self, backend_class):
-        new_backend = next((b for b in self.backends if isinstance(b, backend_class)), None)
-        if new_backend:
-            if self.active_backend:
-                self.stop()
-            self.active_backend = new_backend
-            self.active_backend.on_input_event = self.on_input_event
+        previous_backend = self.active_backend
+        if previous_backend:
+            self.stop()
+        self._ensure_backend(preferred_backend)
+        if previous_backend:
             self.start()
-        else:
-            raise ValueError(f"Backend {backend_class.__name__} is not available")
-
-    def update_backend(self):
-        self.select_backend_from_config()
 
     def start(self):
         if self.active_backend:
+            self._start_callback_worker()
+            self._start_consumer()
             self.active_backend.start()
         else:
             raise RuntimeError("No active backend selected")
@@ -93,62 +101,129 @@ class KeyListener:
     def stop(self):
         if self.active_backend:
             self.active_backend.stop()
+        self._stop_consumer()
+        self._stop_callback_worker()
+
+    def _start_consumer(self):
+        if self._consumer is not None and self._consumer.is_alive():
+            return
+        self._alive = True
+        self._consumer = threading.Thread(target=self._consume_events, name='KeyListenerConsumer', daemon=True)
+        self._consumer.start()
+
+    def _stop_consumer(self):
+        self._alive = False
+        self._event_avail.set()
+        consumer = self._consumer
+        if consumer is None or consumer is threading.current_thread():
+            return
+        # _process only does chord matching and queues callbacks, so this returns promptly;
+        # the reference is only dropped once the thread has exited so start() can't run two
+        consumer.join()
+        self._consumer = None
+
+    def _start_callback_worker(self):
+        if self._cb_queue is not None:
+            return
+        # Each worker gets its own queue and waits for the one it replaces, so callbacks never overlap
+        self._cb_queue = queue.SimpleQueue()
+        self._cb_worker = threading.Thread(target=self._run_callbacks, args=(self._cb_queue, self._cb_worker),
+                                           name='KeyListenerCallbacks', daemon=True)
+        self._cb_worker.start()
+
+    def _stop_callback_worker(self):
+        cb_queue = self._cb_queue
+        if cb_queue is None:
+            return
+        self._cb_queue = None
+        # Discard callbacks that have not run yet so nothing fires after the listener is stopped
+        while True:
+            try:
+                cb_queue.get_nowait()
+            except queue.Empty:
+                break
+        # Not joined: the worker may be inside a callback waiting on a transcription, and stopping
+        # (e.g. on exit) must not wait for it
+        cb_queue.put(_STOP_CALLBACKS)
+
+    def _consume_events(self):
+        """Process queued input events until the listener is stopped."""
+        while self._alive:
+            batch = []
+            while True:
+                try:
+                    batch.append(self._q.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                self._event_avail.wait()
+                self._event_avail.clear()
+                continue
+            self._process(batch)
+
+    def _run_callbacks(self, cb_queue, previous_worker):
+        """Run queued activation/deactivation callbacks in order."""
+        if previous_worker is not None:
+            previous_worker.join()
+        while True:
+            callback = cb_queue.get()
+            if callback is _STOP_CALLBACKS:
+                return
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in key listener callback: {e}")
 
     def load_activation_keys(self):
         key_combination = ConfigManager.get_config_value('recording_options', 'activation_key')
-        keys = self.parse_key_combination(key_combination)
+        keys = KeyListener.parse_key_combination(key_combination)
         self.set_activation_keys(keys)
 
-    def parse_key_combination(self, combination_string: str) -> Set[KeyCode | frozenset[KeyCode]]:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def parse_key_combination(combination_string: str) -> frozenset[KeyCode | frozenset[KeyCode]]:
         keys = set()
-        key_map = {
-            'CTRL': frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT}),
-            'SHIFT': frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT}),
-            'ALT': frozenset({KeyCode.ALT_LEFT, KeyCode.ALT_RIGHT}),
-            'META': frozenset({KeyCode.META_LEFT, KeyCode.META_RIGHT}),
-        }
-
         for key in combination_string.upper().split('+'):
             key = key.strip()
-            if key in key_map:
-                keys.add(key_map[key])
+            keycode = _MOD_MAP.get(key) or _KEYCODE_BY_NAME.get(key)
+            if keycode is not None:
+                keys.add(keycode)
             else:
-                try:
-                    keycode = KeyCode[key]
-                    keys.add(keycode)
-                except KeyError:
-                    print(f"Unknown key: {key}")
-        return keys
+                logger.warning("Unknown key: %s", key)
+        return frozenset(keys)
 
-    def set_activation_keys(self, keys: Set[KeyCode]):
+    def set_activation_keys(self, keys: frozenset[KeyCode | frozenset[KeyCode]]):
+        # KeyChord resolves plain keys and modifier groups into bitmasks once here,
+        # so per-event matching never inspects the slot types
         self.key_chord = KeyChord(keys)
 
     def on_input_event(self, event):
+        """Queue an event from the active backend; called on the backend's input thread."""
+        self._q.append(event)
+        self._event_avail.set()
+
+    def _process(self, events):
         if not self.key_chord or not self.active_backend:
             return
 
-        key, event_type = event
-
         try:
-            was_active = self.key_chord.is_active()
-            is_active = self.key_chord.update(key, event_type)
-
-            if not was_active and is_active:
-                logging.info(f"Activation key combination triggered: {self.key_chord.keys}")
-                self._trigger_callbacks("on_activate")
-            elif was_active and not is_active:
-                logging.info(f"Deactivation of key combination: {self.key_chord.keys}")
-                self._trigger_callbacks("on_deactivate")
+            for transition in self.key_chord.update_batch(events):
+                if transition is ChordTransition.ACTIVATED:
+                    logger.info(f"Activation key combination triggered: {self.key_chord.keys}")
+                    for callback in self._on_activate:
+                        self._cb_queue.put(callback)
+                elif transition is ChordTransition.DEACTIVATED:
+                    logger.info(f"Deactivation of key combination: {self.key_chord.keys}")
+                    for callback in self._on_deactivate:
+                        self._cb_queue.put(callback)
         except Exception as e:
-            logging.error(f"Error processing input event: {e}")
+            logger.error(f"Error processing input events: {e}")
 
     def add_callback(self, event: str, callback: Callable):
-        if event in self.callbacks:
-            self.callbacks[event].append(callback)
-
-    def _trigger_callbacks(self, event: str):
-        for callback in self.callbacks.get(event, []):
-            callback()
+        if event == "on_activate":
+            self._on_activate.append(callback)
+        elif event == "on_deactivate":
+            self._on_deactivate.append(callback)
 
     def update_activation_keys(self):
         self.load_activation_keys()
\ No newline at end of file
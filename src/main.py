@@ -5,6 +5,7 @@ This file initializes the main application, sets up the GUI, and starts the
 WhisperWriterAppManager to manage the overall flow of the program.
 """
 
+import logging
 import os
 import sys
 from PyQt5.QtWidgets import QApplication
@@ -14,6 +15,7 @@ from app_manager import WhisperWriterAppManager
 from utils import ConfigManager
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(filename)s:%(funcName)s] - %(message)s')
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(os.path.join('assets', 'ww-logo.png')))
     ConfigManager.initialize()
@@ -38,19 +38,31 @@ class ResultThread(QThread):
     statusSignal = pyqtSignal(str)
     resultSignal = pyqtSignal(str)
 
-    def __init__(self, local_model=None):
+    def __init__(self, local_model_getter=None):
         """
         Initialize the ResultThread.
 
-        :param local_model: Local transcription model (if applicable)
+        :param local_model_getter: Callable returning the local transcription model (if applicable), called on
+                                   this thread so that waiting for a model still loading in the background
+                                   does not block the UI
         """
         super().__init__()
-        self.local_model = local_model
+        self.local_model_getter = local_model_getter
         self.is_recording = False
         self.is_running = True
         self.sample_rate = None
         self.mutex = QMutex()
 
+    def start_new_recording(self):
+        """Reset the thread state and run another recording cycle, reusing this thread."""
+        if self.isRunning():
+            return
+        self.mutex.lock()
+        self.is_running = True
+        self.is_recording = False
+        self.mutex.unlock()
+        self.start()
+
     def stop_recording(self):
         """Stop the current recording session."""
         self.mutex.lock()
@@ -91,7 +103,8 @@ class ResultThread(QThread):
 
             # Time the transcription process
             start_time = time.time()
-            result = transcribe(audio_data, self.local_model)
+            local_model = self.local_model_getter() if self.local_model_getter else None
+            result = transcribe(audio_data, local_model)
             end_time = time.time()
 
             transcription_time = end_time - start_time
@@ -134,50 +147,49 @@ class ResultThread(QThread):
             speech_detected = False
             silent_frame_count = 0
 
-        audio_buffer = deque(maxlen=frame_size)
+        # The callback hands over one int16 block per frame; frames are kept as-is and
+        # concatenated once at the end instead of being copied sample by sample
+        pending_frames = deque()
         recording = []
+        silence_reached = False
 
         data_ready = Event()
 
         def audio_callback(indata, frames, time, status):
             if status:
                 ConfigManager.console_print(f"Audio callback status: {status}")
-            audio_buffer.extend(indata[:, 0])
+            pending_frames.append(indata[:, 0].copy())
             data_ready.set()
 
         with sd.InputStream(samplerate=self.sample_rate, channels=1, dtype='int16',
                             blocksize=frame_size, device=recording_options.get('sound_device'),
                             callback=audio_callback):
-            while self.is_running and self.is_recording:
+            while self.is_running and self.is_recording and not silence_reached:
                 data_ready.wait()
                 data_ready.clear()
 
-                if len(audio_buffer) < frame_size:
-                    continue
-
-                # Save frame
-                frame = np.array(list(audio_buffer), dtype=np.int16)
-                audio_buffer.clear()
-                recording.extend(frame)
+                while pending_frames and not silence_reached:
+                    # Save frame
+                    frame = pending_frames.popleft()
+                    recording.append(frame)
 
-                # Avoid trying to detect voice in initial frames
-                if initial_frames_to_skip > 0:
-                    initial_frames_to_skip -= 1
-                    continue
+                    # Avoid trying to detect voice in initial frames
+                    if initial_frames_to_skip > 0:
+                        initial_frames_to_skip -= 1
+                        continue
 
-                if vad:
-                    if vad.is_speech(frame.tobytes(), self.sample_rate):
-                        silent_frame_count = 0
-                        if not speech_detected:
-                            ConfigManager.console_print("Speech detected.")
-                            speech_detected = True
-                    else:
-                        silent_frame_count += 1
+                    if vad and len(frame) == frame_size:
+                        if vad.is_speech(frame.tobytes(), self.sample_rate):
+                            silent_frame_count = 0
+                            if not speech_detected:
+                                ConfigManager.console_print("Speech detected.")
+                                speech_detected = True
+                        else:
+                            silent_frame_count += 1
 
-                    if speech_detected and silent_frame_count > silence_frames:
-                        break
+                        silence_reached = speech_detected and silent_frame_count > silence_frames
 
-        audio_data = np.array(recording, dtype=np.int16)
+        audio_data = np.concatenate(recording) if recording else np.empty(0, dtype=np.int16)
         duration = len(audio_data) / self.sample_rate
 
         ConfigManager.console_print(f'Recording finished. Size: {audio_data.size} samples, Duration: {duration:.2f} seconds')
@@ -7,87 +7,149 @@ transcription process for both local and API-based methods.
 
 import io
 import os
+import struct
+import threading
+from functools import lru_cache
 import numpy as np
-import soundfile as sf
-from faster_whisper import WhisperModel
-from openai import OpenAI
 
 from utils import ConfigManager
 
-def create_local_model():
+# Process-wide local model, created once by create_local_model()
+_local_model_lock = threading.Lock()
+_local_model = None
+
+def _resolve_compute_type(device, compute_type):
+    """
+    Pick a quantized compute type when the configured one would run unquantized.
+
+    On CPU, 'default' and 'float16' run in float32, so use int8 instead. On GPU, 'default' becomes
+    int8_float16 when the device supports it. An explicit 'float32' is always respected.
+    """
+    import ctranslate2
+
+    if device == 'auto':
+        device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+
+    if device == 'cpu' and compute_type in ('default', 'float16'):
+        ConfigManager.console_print(f"Compute type '{compute_type}' is not quantized on CPU. Using 'int8' instead.")
+        return 'int8'
+    if device == 'cuda' and compute_type == 'default' and 'int8_float16' in ctranslate2.get_supported_compute_types('cuda'):
+        return 'int8_float16'
+    return compute_type
+
+def _load_local_model():
     """Create a local model using the faster-whisper library."""
+    from faster_whisper import WhisperModel
+
     ConfigManager.console_print('Creating local model...')
     local_model_options = ConfigManager.get_config_section('model_options')['local']
-    compute_type = local_model_options['compute_type']
     model_path = local_model_options.get('model_path')
-    device = 'cpu' if compute_type == 'int8' else local_model_options['device']
+    device = 'cpu' if local_model_options['compute_type'] == 'int8' else local_model_options['device']
 
     try:
         model = WhisperModel(model_path or local_model_options['model'],
                              device=device,
-                             compute_type=compute_type,
+                             compute_type=_resolve_compute_type(device, local_model_options['compute_type']),
                              download_root=None if model_path else None)
     except Exception as e:
         ConfigManager.console_print(f'Error initializing WhisperModel: {e}')
         ConfigManager.console_print('Falling back to CPU.')
         model = WhisperModel(model_path or local_model_options['model'],
                              device='cpu',
-                             compute_type=compute_type,
+                             compute_type=_resolve_compute_type('cpu', local_model_options['compute_type']),
                              download_root=None if model_path else None)
 
     ConfigManager.console_print('Local model created.')
     return model
 
+def create_local_model():
+    """Return the process-wide local model, creating it on first use. Concurrent callers wait for a single load."""
+    global _local_model
+    with _local_model_lock:
+        if _local_model is None:
+            _local_model = _load_local_model()
+        return _local_model
+
 def transcribe_local(audio_data, local_model=None):
     """Transcribe an audio file using a local model."""
     if not local_model:
         local_model = create_local_model()
     model_options = ConfigManager.get_config_section('model_options')
-    audio_data_float = audio_data.astype(np.float32) / 32768.0
+    # Convert int16 samples to [-1, 1) floats in a single pass, without a temporary array
+    audio_data_float = np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32)
     response = local_model.transcribe(audio=audio_data_float,
                                       language=model_options['common']['language'],
                                       initial_prompt=model_options['common']['initial_prompt'],
                                       condition_on_previous_text=model_options['local']['condition_on_previous_text'],
                                       temperature=model_options['common']['temperature'],
                                       vad_filter=model_options['local']['vad_filter'],)
-    return ''.join([segment.text for segment in list(response[0])])
+    return ''.join(segment.text for segment in response[0])
+
+def _wav_header(n_samples, sample_rate, bits=16, channels=1):
+    """Build the 44-byte RIFF/WAVE header for `n_samples` frames of PCM audio."""
+    block_align = channels * bits // 8
+    data_size = n_samples * block_align
+    return struct.pack('<4sI4s4sIHHIIHH4sI',
+                       b'RIFF', 36 + data_size, b'WAVE',
+                       b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits,
+                       b'data', data_size)
+
+@lru_cache(maxsize=4)
+def _get_client(api_key, base_url):
+    """Return an OpenAI client for the given credentials, reusing its connection pool across calls."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key, base_url=base_url)
 
 def transcribe_api(audio_data):
     """Transcribe an audio file using the OpenAI API."""
     model_options = ConfigManager.get_config_section('model_options')
-    client = OpenAI(
-        api_key=os.getenv('OPENAI_API_KEY') or None,
-        base_url=model_options['api']['base_url'] or 'https://api.openai.com/v1'
+    client = _get_client(
+        os.getenv('OPENAI_API_KEY') or None,
+        model_options['api']['base_url'] or 'https://api.openai.com/v1'
     )
     byte_io = io.BytesIO()
     sample_rate = ConfigManager.get_config_section('recording_options').get('sample_rate') or 16000
-    sf.write(byte_io, audio_data, sample_rate, format='wav')
+    audio_format = model_options['api'].get('audio_format') or 'flac'
+    if audio_format == 'wav' and audio_data.dtype == np.dtype('<i2') and audio_data.ndim == 1 and audio_data.flags.c_contiguous:
+        # Mono int16 PCM only needs a header in front of the raw samples
+        byte_io.write(_wav_header(len(audio_data), sample_rate))
+        byte_io.write(audio_data.data)
+    else:
+        import soundfile as sf
+        sf.write(byte_io, audio_data, sample_rate, format=audio_format.upper())
     byte_io.seek(0)
     response = client.audio.transcriptions.create(
         model=model_options['api']['model'],
-        file=('audio.wav', byte_io, 'audio/wav'),
+        file=(f'audio.{audio_format}', byte_io, f'audio/{audio_format}'),
         language=model_options['common']['language'],
         prompt=model_options['common']['initial_prompt'],
         temperature=model_options['common']['temperature'],
     )
     return response.text
 
+@lru_cache(maxsize=8)
+def _build_post_processor(remove_trailing_period, add_trailing_space, remove_capitalization):
+    """Build a single function applying the given combination of post-processing options."""
+    suffix = ' ' if add_trailing_space else ''
+    if remove_trailing_period and remove_capitalization:
+        return lambda text: text.strip().removesuffix('.').lower() + suffix
+    if remove_trailing_period:
+        return lambda text: text.strip().removesuffix('.') + suffix
+    if remove_capitalization:
+        return lambda text: text.strip().lower() + suffix
+    return lambda text: text.strip() + suffix
+
 def post_process_transcription(transcription):
     """Apply post-processing to the transcription."""
-    transcription = transcription.strip()
     post_processing = ConfigManager.get_config_section('post_processing')
-    if post_processing['remove_trailing_period'] and transcription.endswith('.'):
-        transcription = transcription[:-1]
-    if post_processing['add_trailing_space']:
-        transcription += ' '
-    if post_processing['remove_capitalization']:
-        transcription = transcription.lower()
-    return transcription
+    return _build_post_processor(bool(post_processing['remove_trailing_period']),
+                                 bool(post_processing['add_trailing_space']),
+                                 bool(post_processing['remove_capitalization']))(transcription)
 
 def transcribe(audio_data, local_model=None):
     """Transcribe audio data using the OpenAI API or a local model, depending on config."""
     if audio_data is None:
         return ''
-    transcription = transcribe_api(audio_data) if ConfigManager.get_config_value('model_options', 'use_api') else transcribe_local(audio_data, local_model)
+    transcription = transcribe_api(audio_data) if ConfigManager.get_config_section('model_options').get('use_api') else transcribe_local(audio_data, local_model)
     return post_process_transcription(transcription)
 
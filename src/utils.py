@@ -1,5 +1,7 @@
 import yaml
 import os
+from functools import lru_cache
+from types import MappingProxyType
 
 class ConfigManager:
     _instance = None
@@ -26,8 +28,16 @@ class ConfigManager:
         return cls._instance.schema
 
     @classmethod
+    @lru_cache(maxsize=16)
     def get_config_section(cls, *keys):
-        """Get a specific section of the configuration."""
+        """
+        Get a specific section of the configuration.
+
+        Results are cached until the configuration is changed, reloaded or saved. Dict sections are
+        returned as a read-only MappingProxyType over the live config; the proxy is shallow, so
+        nested sections (e.g. get_config_section('model_options')['local']) are still the mutable
+        dicts and must not be modified by callers.
+        """
         if cls._instance is None:
             raise RuntimeError("ConfigManager not initialized")
 
@@ -36,8 +46,8 @@ class ConfigManager:
             if isinstance(section, dict) and key in section:
                 section = section[key]
             else:
-                return {}
-        return section
+                return MappingProxyType({})
+        return MappingProxyType(section) if isinstance(section, dict) else section
 
     @classmethod
     def get_config_value(cls, *keys):
@@ -67,6 +77,7 @@ class ConfigManager:
                 config[key] = {}
             config = config[key]
         config[keys[-1]] = value
+        cls.get_config_section.cache_clear()
 
     @staticmethod
     def load_config_schema(schema_path=None):
@@ -118,6 +129,7 @@ class ConfigManager:
             raise RuntimeError("ConfigManager not initialized")
         with open(config_path, 'w') as file:
             yaml.dump(cls._instance.config, file, default_flow_style=False)
+        cls.get_config_section.cache_clear()
 
     @classmethod
     def reload_config(cls):
@@ -128,6 +140,8 @@ class ConfigManager:
             raise RuntimeError("ConfigManager not initialized")
         cls._instance.config = cls._instance.load_default_config()
         cls._instance.load_user_config()
+        # Clear only once the new config is in place, so a concurrent lookup can't re-cache the old one
+        cls.get_config_section.cache_clear()
 
     @classmethod
     def config_file_exists(cls):